@@ -1,7 +1,6 @@
 import torch
 import torch.nn as nn
 from transformers import AutoModel, AutoConfig, RobertaPreTrainedModel
-from torch.cuda.amp import autocast
 from ..loss import *
 
 
@@ -16,6 +15,8 @@ class ReModel(RobertaPreTrainedModel):
         self.num_labels = args.num_labels
         self.model = AutoModel.from_pretrained(MODEL_NAME, config=self.config)
         self.model.resize_token_embeddings(len(tokenizer))
+        if getattr(args, 'gradient_checkpointing', False):
+            self.model.gradient_checkpointing_enable()
         
         hidden_size = self.config.hidden_size
         dropout_prob = self.config.attention_probs_dropout_prob
@@ -33,7 +34,6 @@ class ReModel(RobertaPreTrainedModel):
         )
         
     
-    @autocast()
     def forward(
         self,
         input_ids=None,
@@ -1,240 +1,320 @@
-import pickle as pickle
-import pandas as pd
-import torch
-import random
-import sklearn
-import numpy as np
-from sklearn.metrics import accuracy_score
-from sklearn.model_selection import StratifiedShuffleSplit
-from transformers import AutoTokenizer, AutoConfig, AutoModelForSequenceClassification, Trainer, TrainingArguments
-import wandb
-import argparse
-from importlib import import_module
-from trainer import CustomTrainer
-
-
-def seed_everything(seed):
-    torch.manual_seed(seed)
-    torch.cuda.manual_seed(seed)
-    torch.cuda.manual_seed_all(seed)  # if use multi-GPU
-    torch.backends.cudnn.deterministic = True
-    torch.backends.cudnn.benchmark = False
-    np.random.seed(seed)
-    random.seed(seed)
-
-def klue_re_micro_f1(preds, labels):
-    """KLUE-RE micro f1 (except no_relation)"""
-    label_list = ['no_relation', 'org:top_members/employees', 'org:members',
-       'org:product', 'per:title', 'org:alternate_names',
-       'per:employee_of', 'org:place_of_headquarters', 'per:product',
-       'org:number_of_employees/members', 'per:children',
-       'per:place_of_residence', 'per:alternate_names',
-       'per:other_family', 'per:colleagues', 'per:origin', 'per:siblings',
-       'per:spouse', 'org:founded', 'org:political/religious_affiliation',
-       'org:member_of', 'per:parents', 'org:dissolved',
-       'per:schools_attended', 'per:date_of_death', 'per:date_of_birth',
-       'per:place_of_birth', 'per:place_of_death', 'org:founded_by',
-       'per:religion']
-    no_relation_label_idx = label_list.index("no_relation")
-    label_indices = list(range(len(label_list)))
-    label_indices.remove(no_relation_label_idx)
-    return sklearn.metrics.f1_score(labels, preds, average="micro", labels=label_indices) * 100.0
-
-def klue_re_auprc(probs, labels):
-    """KLUE-RE AUPRC (with no_relation)"""
-    labels = np.eye(30)[labels]
-
-    score = np.zeros((30,))
-    for c in range(30):
-        targets_c = labels.take([c], axis=1).ravel()
-        preds_c = probs.take([c], axis=1).ravel()
-        precision, recall, _ = sklearn.metrics.precision_recall_curve(targets_c, preds_c)
-        score[c] = sklearn.metrics.auc(recall, precision)
-    return np.average(score) * 100.0
-
-def compute_metrics(pred):
-  """ validation을 위한 metrics function """
-  labels = pred.label_ids
-  preds = pred.predictions.argmax(-1)
-  probs = pred.predictions
-
-  # calculate accuracy using sklearn's function
-  f1 = klue_re_micro_f1(preds, labels)
-  auprc = klue_re_auprc(probs, labels)
-  acc = accuracy_score(labels, preds) # 리더보드 평가에는 포함되지 않습니다.
-
-  return {
-      'micro f1 score': f1,
-      'auprc' : auprc,
-      'accuracy': acc,
-  }
-
-def label_to_num(label):
-  num_label = []
-  with open('dict_label_to_num.pkl', 'rb') as f:
-    dict_label_to_num = pickle.load(f)
-  for v in label:
-    num_label.append(dict_label_to_num[v])
-  
-  return num_label
-
-def train(args):
-  # load model and tokenizer
-  MODEL_NAME = args.model
-  tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, additional_special_tokens=['#', '@'])
-
-  # load dataset
-  load = getattr(import_module(args.load_data_filename), args.load_data_func_load)
-  dataset = load(args.train_data)
-
-  split = StratifiedShuffleSplit(n_splits=args.n_splits, test_size=args.test_size, random_state=args.seed)
-
-  for train_idx, test_idx in split.split(dataset, dataset["label"]):
-      train_dataset = dataset.loc[train_idx]
-      dev_dataset = dataset.loc[test_idx]
-  
-  if args.use_augmentation: # added for augmentation
-    dev_index = dev_dataset['id'].tolist() # added for augmentation
-    aug_dataset1 = load('../dataset/train/augmented_phonologicalProcess.csv')
-    aug_dataset2 = load('../dataset/train/augmented_vowelNoise.csv')
-    temp = pd.concat([train_dataset, aug_dataset1, aug_dataset2]).drop_duplicates(['sentence', 'subject_entity', 'object_entity', 'label'])
-    train_dataset = temp[~temp['id'].isin(dev_index)]
-
-  train_label = label_to_num(train_dataset['label'].values)
-  dev_label = label_to_num(dev_dataset['label'].values)
-
-  # tokenizing dataset
-  tokenize = getattr(import_module(args.load_data_filename), args.load_data_func_tokenized)
-  tokenized_train = tokenize(train_dataset, tokenizer, args.special_entity_type, args.preprocess, args.clue_type)
-  tokenized_dev = tokenize(dev_dataset, tokenizer, args.special_entity_type, args.preprocess, args.clue_type)
-
-  # make dataset for pytorch.
-  re_data = getattr(import_module(args.load_data_filename), args.load_data_class)
-  RE_train_dataset = re_data(tokenized_train, train_label)
-  RE_dev_dataset = re_data(tokenized_dev, dev_label)
-
-  device = torch.device('cuda:0' if torch.cuda.is_available() else 'cpu')
-
-  print(device)
-  # setting model hyperparameter
-  model_config =  AutoConfig.from_pretrained(MODEL_NAME)
-  model_config.num_labels = args.num_labels
-
-  model_config.classifier_dropout = args.dropout # gives dropout to classifier layer
-
-  model =  AutoModelForSequenceClassification.from_pretrained(MODEL_NAME, config=model_config)
-  model.resize_token_embeddings(len(tokenizer))
-  model.parameters
-  model.to(device)
-
-  wandb.init(project=args.project_name, entity=args.entity_name)
-  wandb.run.name = args.run_name
-  
-  # 사용한 option 외에도 다양한 option들이 있습니다.
-  # https://huggingface.co/transformers/main_classes/trainer.html#trainingarguments 참고해주세요.
-  training_args = TrainingArguments(
-    output_dir=args.output_dir,                     # output directory
-    save_total_limit=args.save_total_limit,         # number of total save model.
-    save_steps=args.save_steps,                     # model saving step.
-    num_train_epochs=args.num_train_epochs,         # total number of training epochs
-    learning_rate=args.learning_rate,               # learning rate
-    per_device_train_batch_size=args.per_device_train_batch_size,  # batch size per device during training
-    per_device_eval_batch_size=args.per_device_eval_batch_size,   # batch size for evaluation
-    warmup_steps=args.warmup_steps,                # number of warmup steps for learning rate scheduler
-    warmup_ratio=args.warmup_ratio,                # Ratio of total training steps used for a linear warmup from 0 to learning_rate.
-    weight_decay=args.weight_decay,                # strength of weight decay
-    logging_dir=args.logging_dir,                  # directory for storing logs
-    logging_steps=args.logging_steps,              # log saving step.
-    evaluation_strategy=args.evaluation_strategy,  # evaluation strategy to adopt during training
-                                                    # `no`: No evaluation during training.
-                                                    # `steps`: Evaluate every `eval_steps`.
-                                                    # `epoch`: Evaluate every end of epoch.
-    eval_steps = args.eval_steps,                             # evaluation step.
-    load_best_model_at_end = args.load_best_model_at_end,     # Whether or not to load the best model found during training at the end of training.
-    report_to=args.report_to,                                 # The list of integrations to report the results and logs to.
-    metric_for_best_model=args.metric_for_best_model,         # Use in conjunction with load_best_model_at_end to specify the metric to use to compare two different models.
-    gradient_accumulation_steps=args.gradient_accumulation_steps,  # Number of updates steps to accumulate the gradients for, before performing a backward/update pass.
-    fp16=True,                # Whether to use fp16 16-bit (mixed) precision training instead of 32-bit training.     
-  )
-
-  if args.loss=="cross":
-    trainer = Trainer(
-      model=model,                         # the instantiated 🤗 Transformers model to be trained
-      args=training_args,                  # training arguments, defined above
-      train_dataset=RE_train_dataset,         # training dataset
-      eval_dataset=RE_dev_dataset,             # evaluation dataset
-      compute_metrics=compute_metrics         # define metrics function
-    )
-
-  elif args.loss=="focal":
-    trainer = CustomTrainer(
-      model=model,                         # the instantiated 🤗 Transformers model to be trained
-      args=training_args,                  # training arguments, defined above
-      train_dataset=RE_train_dataset,         # training dataset
-      eval_dataset=RE_dev_dataset,             # evaluation dataset
-      compute_metrics=compute_metrics         # define metrics function
-    )
-  
-  # train model
-  trainer.train()
-  wandb.finish()
-
-  model.save_pretrained(args.save_pretrained)
-
-def main(args):
-  train(args)
-
-if __name__ == '__main__':
-  parser = argparse.ArgumentParser()
-  
-  # Data and model checkpoints directories
-  parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
-  parser.add_argument("--model", type=str, default="klue/bert-base", help="model to train (default: klue/bert-base)")
-  parser.add_argument("--train_data", type=str, default="../dataset/train/train.csv", help="train_data directory (default: ../dataset/train/train.csv)")
-  parser.add_argument("--num_labels", type=int, default=30, help="number of labels (default: 30)")
-  parser.add_argument("--output_dir", type=str, default="./results", help="directory which stores various outputs (default: ./results)")
-  parser.add_argument("--save_total_limit", type=int, default=5, help="max number of saved models (default: 5)")
-  parser.add_argument("--save_steps", type=int, default=500, help="interval of saving model (default: 500)")
-  parser.add_argument("--num_train_epochs", type=int, default=20, help="number of train epochs (default: 20)")
-  parser.add_argument("--learning_rate", type=float, default=5e-5, help="learning rate (default: 5e-5)")
-  parser.add_argument("--per_device_train_batch_size", type=int, default=16, help=" (default: 16)")
-  parser.add_argument("--per_device_eval_batch_size", type=int, default=16, help=" (default: 16)")
-  parser.add_argument("--warmup_steps", type=int, default=500, help=" (default: 500)")
-  parser.add_argument("--warmup_ratio", type=float, default=0.1, help=" (default: 0.1")
-  parser.add_argument("--weight_decay", type=float, default=0.01, help=" (default: 0.01)")
-  parser.add_argument("--logging_dir", type=str, default="./logs", help=" (default: ./logs)")
-  parser.add_argument("--logging_steps", type=int, default=100, help=" (default: 100)")
-  parser.add_argument("--evaluation_strategy", type=str, default="steps", help=" (default: steps)")
-  parser.add_argument("--eval_steps", type=int, default=500, help=" (default: 500)")
-  parser.add_argument("--load_best_model_at_end", type=bool, default=True, help=" (default: True)")
-  parser.add_argument("--save_pretrained", type=str, default="./best_model", help=" (default: ./best_model)")
-
-  # updated
-  parser.add_argument('--run_name', type=str, default="baseline")
-  parser.add_argument('--special_entity_type', type=str, default="typed_entity", choices=["baseline", "punct", "entity", "typed_entity"], help="(default: typed_entity)")
-  parser.add_argument('--preprocess', type=bool, default=False, help="apply preprocess")
-  parser.add_argument('--clue_type', type=str, default="question", choices=["question", "entity"], help="(default: question)")
-
-  parser.add_argument("--n_splits", type=int, default=1, help=" (default: 1)")
-  parser.add_argument("--test_size", type=float, default=0.1, help=" (default: 0.1)")
-  parser.add_argument("--project_name", type=str, default="Model_Test", help=" (default: Model_Test)")
-  parser.add_argument("--entity_name", type=str, default="growing_sesame", help=" (default: growing_sesame)")
-  parser.add_argument("--report_to", type=str, default="wandb", help=" (default: wandb)")
-  parser.add_argument("--metric_for_best_model", type=str, default="eval_loss", help=" (default: eval_loss)")
-  parser.add_argument("--gradient_accumulation_steps", type=int, default=1, help=" (default: 1)")
-  parser.add_argument("--loss", type=str, default="cross", help="(default: cross)")
-  parser.add_argument("--dropout", type=float, default=0.1, help=" (default: 0.1)")
-
-  # load_data module
-  parser.add_argument('--load_data_filename', type=str, default="load_data")
-  parser.add_argument('--load_data_func_load', type=str, default="load_data")
-  parser.add_argument('--load_data_func_tokenized', type=str, default="tokenized_dataset")
-  parser.add_argument('--load_data_class', type=str, default="RE_Dataset")
-  parser.add_argument('--load_data_func_tokenized_train', type=str, default="tokenized_dataset")
-  
-  args = parser.parse_args()
-  print(args)
-
-  seed_everything(args.seed)
-  
-  main(args)
+import pickle as pickle
+import pandas as pd
+import torch
+import random
+import sklearn
+import numpy as np
+from sklearn.model_selection import StratifiedShuffleSplit
+from transformers import AutoTokenizer, AutoConfig, AutoModelForSequenceClassification, DataCollatorWithPadding, Trainer, TrainingArguments
+import wandb
+import argparse
+import hashlib
+import os
+from importlib import import_module
+from trainer import CustomTrainer, PrefetchTrainer
+
+
+def seed_everything(seed, deterministic=False):
+    torch.manual_seed(seed)
+    torch.cuda.manual_seed(seed)
+    torch.cuda.manual_seed_all(seed)  # if use multi-GPU
+    if deterministic:
+        torch.backends.cudnn.deterministic = True
+        torch.backends.cudnn.benchmark = False
+    else:
+        # cuDNN autotuner + TF32 tensor-core matmul on Ampere+
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+    np.random.seed(seed)
+    random.seed(seed)
+
+LABEL_LIST = ['no_relation', 'org:top_members/employees', 'org:members',
+   'org:product', 'per:title', 'org:alternate_names',
+   'per:employee_of', 'org:place_of_headquarters', 'per:product',
+   'org:number_of_employees/members', 'per:children',
+   'per:place_of_residence', 'per:alternate_names',
+   'per:other_family', 'per:colleagues', 'per:origin', 'per:siblings',
+   'per:spouse', 'org:founded', 'org:political/religious_affiliation',
+   'org:member_of', 'per:parents', 'org:dissolved',
+   'per:schools_attended', 'per:date_of_death', 'per:date_of_birth',
+   'per:place_of_birth', 'per:place_of_death', 'org:founded_by',
+   'per:religion']
+_NO_RELATION_IDX = LABEL_LIST.index("no_relation")
+_MICRO_F1_LABEL_INDICES = [i for i in range(len(LABEL_LIST)) if i != _NO_RELATION_IDX]
+
+def klue_re_micro_f1(confusion):
+    """KLUE-RE micro f1 (except no_relation), confusion matrix로부터 계산"""
+    idx = np.asarray(_MICRO_F1_LABEL_INDICES)
+    tp = confusion[idx, idx].sum()                      # pred == true, no_relation 제외
+    pred_sum = confusion[:, idx].sum()                  # no_relation 외 클래스로 예측한 수
+    true_sum = confusion[idx, :].sum()                  # no_relation 외 정답 수
+    if pred_sum + true_sum == 0:
+        return 0.0
+    return 2.0 * tp / (pred_sum + true_sum) * 100.0
+
+_EYE30 = np.eye(30, dtype=np.float32)  # float32 one-hot lookup table, allocated once
+
+def klue_re_auprc(probs, labels):
+    """KLUE-RE AUPRC (with no_relation)"""
+    # macro AP == 클래스별 precision-recall curve 면적의 평균, 한 번의 vectorized 호출로 계산
+    return sklearn.metrics.average_precision_score(_EYE30[labels], probs, average="macro") * 100.0
+
+def compute_metrics(pred):
+  """ validation을 위한 metrics function """
+  labels = pred.label_ids
+  preds = pred.predictions.argmax(-1).astype(np.int32)
+  probs = pred.predictions
+
+  # confusion matrix 한 번으로 micro f1과 accuracy를 모두 도출 (예측 배열은 한 번만 스캔)
+  confusion = sklearn.metrics.confusion_matrix(labels, preds, labels=np.arange(len(LABEL_LIST)))
+  f1 = klue_re_micro_f1(confusion)
+  auprc = klue_re_auprc(probs, labels)
+  acc = np.trace(confusion) / confusion.sum() # 리더보드 평가에는 포함되지 않습니다.
+
+  return {
+      'micro f1 score': f1,
+      'auprc' : auprc,
+      'accuracy': acc,
+  }
+
+_dict_label_to_num = None
+
+def label_to_num(label):
+  global _dict_label_to_num
+  if _dict_label_to_num is None:  # unpickle once, reuse for every call
+    with open('dict_label_to_num.pkl', 'rb') as f:
+      _dict_label_to_num = pickle.load(f)
+
+  return np.fromiter((_dict_label_to_num[v] for v in label), dtype=np.int64, count=len(label))
+
+def cached_tokenize(tokenize, dataset, tokenizer, args, split_name):
+  """ 토크나이징 결과를 .cache/에 저장해 두고, 같은 설정의 다음 실험에서 재사용 합니다. """
+  key = hashlib.md5('|'.join([
+      'v2',  # cache format version, bump when tokenized_dataset output changes
+      args.model, args.load_data_filename, args.load_data_func_tokenized,
+      args.special_entity_type, str(args.preprocess), args.clue_type,
+      str(pd.util.hash_pandas_object(dataset).sum()),
+  ]).encode()).hexdigest()
+  cache_file = os.path.join('.cache', 'tok_%s_%s.pt' % (split_name, key))
+
+  if os.path.exists(cache_file):
+    # BatchEncoding은 tensor가 아니므로 weights_only unpickling으로는 복원되지 않습니다
+    return torch.load(cache_file, weights_only=False)
+
+  tokenized = tokenize(dataset, tokenizer, args.special_entity_type, args.preprocess, args.clue_type)
+
+  # torchrun 시 rank 0만 기록하고, tmp 파일 + os.replace로 중간에 죽어도 깨진 cache가 남지 않게 합니다
+  if int(os.environ.get("RANK", "0")) == 0:
+    os.makedirs('.cache', exist_ok=True)
+    tmp_file = '%s.tmp.%d' % (cache_file, os.getpid())
+    torch.save(tokenized, tmp_file)
+    os.replace(tmp_file, cache_file)
+
+  return tokenized
+
+def train(args):
+  if not args.deterministic and hasattr(torch, 'set_float32_matmul_precision'):
+    torch.set_float32_matmul_precision('high')  # route remaining fp32 matmuls through TF32 tensor cores
+
+  # load model and tokenizer
+  MODEL_NAME = args.model
+  tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, use_fast=True, additional_special_tokens=['#', '@'])
+
+  # load dataset
+  load = getattr(import_module(args.load_data_filename), args.load_data_func_load)
+  dataset = load(args.train_data)
+
+  split = StratifiedShuffleSplit(n_splits=args.n_splits, test_size=args.test_size, random_state=args.seed)
+
+  # 첫 번째 split만 사용; sklearn이 반환하는 index는 positional이므로 iloc으로 선택
+  train_idx, test_idx = next(split.split(dataset, dataset["label"]))
+  train_dataset = dataset.iloc[train_idx]
+  dev_dataset = dataset.iloc[test_idx]
+
+
+  if args.use_augmentation: # added for augmentation
+    dev_index = dev_dataset['id'].tolist() # added for augmentation
+    aug_dataset1 = load('../dataset/train/augmented_phonologicalProcess.csv')
+    aug_dataset2 = load('../dataset/train/augmented_vowelNoise.csv')
+    temp = pd.concat([train_dataset, aug_dataset1, aug_dataset2]).drop_duplicates(['sentence', 'subject_entity', 'object_entity', 'label'])
+    train_dataset = temp[~temp['id'].isin(dev_index)]
+
+  train_label = label_to_num(train_dataset['label'].values)
+  dev_label = label_to_num(dev_dataset['label'].values)
+
+  # tokenizing dataset (cached on disk, keyed by data + tokenize options)
+  tokenize = getattr(import_module(args.load_data_filename), args.load_data_func_tokenized)
+  tokenized_train = cached_tokenize(tokenize, train_dataset, tokenizer, args, 'train')
+  tokenized_dev = cached_tokenize(tokenize, dev_dataset, tokenizer, args, 'dev')
+
+  # make dataset for pytorch.
+  re_data = getattr(import_module(args.load_data_filename), args.load_data_class)
+  RE_train_dataset = re_data(tokenized_train, train_label)
+  RE_dev_dataset = re_data(tokenized_dev, dev_label)
+
+  # setting model hyperparameter
+  model_config =  AutoConfig.from_pretrained(MODEL_NAME)
+  model_config.num_labels = args.num_labels
+
+  model_config.classifier_dropout = args.dropout # gives dropout to classifier layer
+
+  model =  AutoModelForSequenceClassification.from_pretrained(MODEL_NAME, config=model_config)
+  model.resize_token_embeddings(len(tokenizer))
+  # device placement is handled by Trainer (DDP-aware when launched via torchrun)
+
+  if args.compile and hasattr(torch, 'compile'):
+    # first training step pays the compilation cost, every step after runs fused kernels
+    model = torch.compile(model, mode='reduce-overhead', fullgraph=False)
+
+  # torchrun 실행 시 rank 0만 wandb run을 만듭니다 (다른 rank는 중복 run 생성)
+  is_main_process = int(os.environ.get("RANK", "0")) == 0
+  if is_main_process:
+    wandb.init(project=args.project_name, entity=args.entity_name)
+    wandb.run.name = args.run_name
+
+  # 사용한 option 외에도 다양한 option들이 있습니다.
+  # https://huggingface.co/transformers/main_classes/trainer.html#trainingarguments 참고해주세요.
+  training_args = TrainingArguments(
+    output_dir=args.output_dir,                     # output directory
+    save_total_limit=args.save_total_limit,         # number of total save model.
+    save_strategy=args.save_strategy,               # checkpoint cadence; keep equal to evaluation_strategy for load_best_model_at_end.
+    save_steps=args.save_steps,                     # model saving step.
+    save_safetensors=True,                          # zero-copy safetensors serialization, mmap-friendly for best-model reload.
+    num_train_epochs=args.num_train_epochs,         # total number of training epochs
+    learning_rate=args.learning_rate,               # learning rate
+    per_device_train_batch_size=args.per_device_train_batch_size,  # batch size per device during training
+    per_device_eval_batch_size=args.per_device_eval_batch_size,   # batch size for evaluation
+    warmup_steps=args.warmup_steps,                # number of warmup steps for learning rate scheduler
+    warmup_ratio=args.warmup_ratio,                # Ratio of total training steps used for a linear warmup from 0 to learning_rate.
+    weight_decay=args.weight_decay,                # strength of weight decay
+    logging_dir=args.logging_dir,                  # directory for storing logs
+    logging_steps=args.logging_steps,              # log saving step.
+    evaluation_strategy=args.evaluation_strategy,  # evaluation strategy to adopt during training
+                                                    # `no`: No evaluation during training.
+                                                    # `steps`: Evaluate every `eval_steps`.
+                                                    # `epoch`: Evaluate every end of epoch.
+    eval_steps = args.eval_steps,                             # evaluation step.
+    load_best_model_at_end = args.load_best_model_at_end,     # Whether or not to load the best model found during training at the end of training.
+    report_to=args.report_to,                                 # The list of integrations to report the results and logs to.
+    metric_for_best_model=args.metric_for_best_model,         # Use in conjunction with load_best_model_at_end to specify the metric to use to compare two different models.
+    gradient_accumulation_steps=args.gradient_accumulation_steps,  # Number of updates steps to accumulate the gradients for, before performing a backward/update pass.
+    ddp_find_unused_parameters=args.ddp_find_unused_parameters,    # Skip the unused-parameter scan in DistributedDataParallel; every parameter here gets a gradient.
+    dataloader_drop_last=args.dataloader_drop_last,                # Drop the ragged last batch so AllReduce shapes stay static under DDP.
+    dataloader_num_workers=args.dataloader_num_workers,            # Subprocesses for data loading so batch prep overlaps GPU compute.
+    dataloader_pin_memory=True,                                    # Page-locked host buffers enable non-blocking H2D copies.
+    dataloader_persistent_workers=args.dataloader_num_workers > 0, # Keep workers alive between epochs instead of re-forking.
+    dataloader_prefetch_factor=4 if args.dataloader_num_workers > 0 else None,  # Batches each worker prepares ahead of time.
+    group_by_length=args.group_by_length,                          # Bucket similar-length sentences together so dynamic padding pads less.
+    gradient_checkpointing=args.gradient_checkpointing,            # Recompute activations in backward (~30% extra FLOPs) to fit larger batches.
+    optim=args.optim,                                              # Fused AdamW updates each param group in one CUDA kernel.
+    fp16=True,                # Whether to use fp16 16-bit (mixed) precision training instead of 32-bit training.
+  )
+
+  # dynamic padding: batch 안에서 제일 긴 문장까지만 padding (8의 배수로 맞춰 tensor-core 정렬 유지)
+  data_collator = DataCollatorWithPadding(tokenizer, pad_to_multiple_of=8)
+
+  if args.loss=="cross":
+    trainer = PrefetchTrainer(
+      model=model,                         # the instantiated 🤗 Transformers model to be trained
+      args=training_args,                  # training arguments, defined above
+      train_dataset=RE_train_dataset,         # training dataset
+      eval_dataset=RE_dev_dataset,             # evaluation dataset
+      data_collator=data_collator,         # dynamic padding per batch
+      compute_metrics=compute_metrics         # define metrics function
+    )
+
+  elif args.loss=="focal":
+    trainer = CustomTrainer(
+      model=model,                         # the instantiated 🤗 Transformers model to be trained
+      args=training_args,                  # training arguments, defined above
+      train_dataset=RE_train_dataset,         # training dataset
+      eval_dataset=RE_dev_dataset,             # evaluation dataset
+      data_collator=data_collator,         # dynamic padding per batch
+      compute_metrics=compute_metrics         # define metrics function
+    )
+  
+  # train model
+  trainer.train()
+
+  # rank 0만 저장: 여러 rank가 같은 ./best_model 디렉토리에 동시에 쓰면 파일이 깨집니다
+  if trainer.is_world_process_zero():
+    wandb.finish()
+    model.save_pretrained(args.save_pretrained)
+
+def str2bool(v):
+  """ argparse용 boolean 파서: type=bool은 'False' 같은 문자열도 True로 읽어버립니다. """
+  if isinstance(v, bool):
+    return v
+  if v.lower() in ('true', 't', '1'):
+    return True
+  if v.lower() in ('false', 'f', '0'):
+    return False
+  raise argparse.ArgumentTypeError('expected True or False, got %r' % v)
+
+def main(args):
+  train(args)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser()
+  
+  # Data and model checkpoints directories
+  parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+  parser.add_argument("--deterministic", type=str2bool, default=False, help="bit-exact cuDNN determinism, disables autotuner and TF32 (default: False)")
+  parser.add_argument("--model", type=str, default="klue/bert-base", help="model to train (default: klue/bert-base)")
+  parser.add_argument("--train_data", type=str, default="../dataset/train/train.csv", help="train_data directory (default: ../dataset/train/train.csv)")
+  parser.add_argument("--num_labels", type=int, default=30, help="number of labels (default: 30)")
+  parser.add_argument("--output_dir", type=str, default="./results", help="directory which stores various outputs (default: ./results)")
+  parser.add_argument("--save_total_limit", type=int, default=5, help="max number of saved models (default: 5)")
+  parser.add_argument("--save_steps", type=int, default=500, help="interval of saving model, keep aligned with --eval_steps (default: 500)")
+  parser.add_argument("--save_strategy", type=str, default="steps", help="checkpoint cadence, 'epoch' cuts storage churn but must match --evaluation_strategy when load_best_model_at_end is set (default: steps)")
+  parser.add_argument("--num_train_epochs", type=int, default=20, help="number of train epochs (default: 20)")
+  parser.add_argument("--learning_rate", type=float, default=5e-5, help="learning rate (default: 5e-5)")
+  parser.add_argument("--per_device_train_batch_size", type=int, default=16, help=" (default: 16)")
+  parser.add_argument("--per_device_eval_batch_size", type=int, default=16, help=" (default: 16)")
+  parser.add_argument("--warmup_steps", type=int, default=500, help=" (default: 500)")
+  parser.add_argument("--warmup_ratio", type=float, default=0.1, help=" (default: 0.1")
+  parser.add_argument("--weight_decay", type=float, default=0.01, help=" (default: 0.01)")
+  parser.add_argument("--logging_dir", type=str, default="./logs", help=" (default: ./logs)")
+  parser.add_argument("--logging_steps", type=int, default=100, help=" (default: 100)")
+  parser.add_argument("--evaluation_strategy", type=str, default="steps", help=" (default: steps)")
+  parser.add_argument("--eval_steps", type=int, default=500, help=" (default: 500)")
+  parser.add_argument("--load_best_model_at_end", type=bool, default=True, help=" (default: True)")
+  parser.add_argument("--save_pretrained", type=str, default="./best_model", help=" (default: ./best_model)")
+
+  # updated
+  parser.add_argument('--run_name', type=str, default="baseline")
+  parser.add_argument('--special_entity_type', type=str, default="typed_entity", choices=["baseline", "punct", "entity", "typed_entity"], help="(default: typed_entity)")
+  parser.add_argument('--preprocess', type=bool, default=False, help="apply preprocess")
+  parser.add_argument('--clue_type', type=str, default="question", choices=["question", "entity"], help="(default: question)")
+
+  parser.add_argument("--n_splits", type=int, default=1, help=" (default: 1)")
+  parser.add_argument("--test_size", type=float, default=0.1, help=" (default: 0.1)")
+  parser.add_argument("--project_name", type=str, default="Model_Test", help=" (default: Model_Test)")
+  parser.add_argument("--entity_name", type=str, default="growing_sesame", help=" (default: growing_sesame)")
+  parser.add_argument("--report_to", type=str, default="wandb", help=" (default: wandb)")
+  parser.add_argument("--metric_for_best_model", type=str, default="eval_loss", help=" (default: eval_loss)")
+  parser.add_argument("--gradient_accumulation_steps", type=int, default=1, help="micro-batches per optimizer step; e.g. batch 32 x 4 steps = effective batch 128 without extra memory (default: 1)")
+  parser.add_argument("--ddp_find_unused_parameters", type=str2bool, default=False, help=" (default: False)")
+  parser.add_argument("--dataloader_drop_last", type=str2bool, default=True, help="drop the ragged last train batch for static DDP shapes (default: True)")
+  parser.add_argument("--dataloader_num_workers", type=int, default=min(8, os.cpu_count() // 2), help="DataLoader worker processes (default: min(8, cpu_count/2))")
+  parser.add_argument("--group_by_length", type=str2bool, default=True, help="length-bucketed sampling for less padding (default: True)")
+  parser.add_argument("--gradient_checkpointing", type=str2bool, default=False, help="trade compute for activation memory to raise batch size (default: False)")
+  parser.add_argument("--optim", type=str, default="adamw_torch_fused", help="optimizer, needs torch>=2.0; pass adamw_torch on older installs (default: adamw_torch_fused)")
+  parser.add_argument("--compile", type=str2bool, default=False, help="JIT-compile the model with torch.compile, torch>=2.0 only (default: False)")
+  parser.add_argument("--loss", type=str, default="cross", help="(default: cross)")
+  parser.add_argument("--dropout", type=float, default=0.1, help=" (default: 0.1)")
+
+  # load_data module
+  parser.add_argument('--load_data_filename', type=str, default="load_data")
+  parser.add_argument('--load_data_func_load', type=str, default="load_data")
+  parser.add_argument('--load_data_func_tokenized', type=str, default="tokenized_dataset")
+  parser.add_argument('--load_data_class', type=str, default="RE_Dataset")
+  parser.add_argument('--load_data_func_tokenized_train', type=str, default="tokenized_dataset")
+  
+  args = parser.parse_args()
+  print(args)
+
+  seed_everything(args.seed, args.deterministic)
+
+  main(args)
@@ -1,4 +1,7 @@
 # How to use: type 'sh train.sh' on your CLI
+# Multi-GPU: replace 'python' with 'torchrun --nproc_per_node=<N>' and Trainer runs DDP automatically
+# Effective batch = per_device_train_batch_size * gradient_accumulation_steps * n_gpus,
+# e.g. --per_device_train_batch_size 32 --gradient_accumulation_steps 4 for effective 128 without OOM
 python train.py \
 --load_data_filename load_data_junejae \
 --load_data_func_load load_data \
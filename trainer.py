@@ -1,13 +1,79 @@
+import torch
 from transformers import Trainer
 from loss import FocalLoss
 
-class CustomTrainer(Trainer):
+class CUDAPrefetcher:
+    """DataLoader wrapper that copies the next batch to the GPU on a side CUDA
+    stream, so the host-to-device transfer overlaps the current step's compute.
+    The wrapped loader must yield CPU (ideally pinned) batches."""
+    def __init__(self, dataloader, device):
+        self.dataloader = dataloader
+        self.device = device
+        self.stream = torch.cuda.Stream(device)
+
+    def __len__(self):
+        return len(self.dataloader)
+
+    def __getattr__(self, name):
+        # delegate everything else (dataset, batch_size, ...) to the wrapped loader
+        return getattr(self.dataloader, name)
+
+    def _preload(self, it):
+        try:
+            batch = next(it)
+        except StopIteration:
+            return None
+        # accelerate의 DataLoaderShard는 마지막 batch를 내줄 때 end_of_dataloader를 올립니다
+        is_final = getattr(self.dataloader, 'end_of_dataloader', False)
+        with torch.cuda.stream(self.stream):
+            batch = {k: v.to(self.device, non_blocking=True) if isinstance(v, torch.Tensor) else v
+                     for k, v in batch.items()}
+        return batch, is_final
+
+    def __iter__(self):
+        it = iter(self.dataloader)
+        item = self._preload(it)
+        while item is not None:
+            batch, is_final = item
+            # make sure the side-stream copy finished before the batch is consumed
+            torch.cuda.current_stream(self.device).wait_stream(self.stream)
+            for v in batch.values():
+                if isinstance(v, torch.Tensor):
+                    v.record_stream(torch.cuda.current_stream(self.device))
+            # 마지막 batch는 미리 당겨오지 않습니다: lookahead가 GradientState의
+            # end_of_dataloader를 한 step 일찍 뒤집어 gradient accumulation을 끊기 때문
+            item = None if is_final else self._preload(it)
+            if hasattr(self.dataloader, 'end_of_dataloader'):
+                # 지금 내보내는 batch 기준으로 flag를 되돌립니다 (lookahead가 미리 올렸을 수 있음)
+                self.dataloader.end_of_dataloader = is_final
+            yield batch
+        # 남은 StopIteration까지 소진해 DataLoaderShard가 GradientState 정리를 마치게 합니다
+        for _ in it:
+            pass
+
+class PrefetchTrainer(Trainer):
+    """Trainer whose train DataLoader prefetches batches onto the GPU."""
+    def get_train_dataloader(self):
+        if not torch.cuda.is_available():
+            return super().get_train_dataloader()
+        # accelerate가 device placement까지 하면 batch가 default stream에서 이미
+        # GPU로 옮겨진 뒤라 prefetch가 no-op이 됩니다. sharding만 맡기고
+        # H2D copy는 이 wrapper의 side stream이 담당합니다.
+        device_placement = self.accelerator.device_placement
+        self.accelerator.device_placement = False
+        try:
+            dataloader = super().get_train_dataloader()
+        finally:
+            self.accelerator.device_placement = device_placement
+        return CUDAPrefetcher(dataloader, self.args.device)
+
+class CustomTrainer(PrefetchTrainer):
     def compute_loss(self, model, inputs, return_outputs=False):
         labels = inputs.get("labels")
         # forward pass
         outputs = model(**inputs)
-        logits = outputs.get("logits")  
+        logits = outputs.get("logits")
         # compute custom loss (suppose one has 3 labels with different weights)
         loss_fct = FocalLoss()
         loss = loss_fct(logits.view(-1, self.model.config.num_labels), labels.view(-1))
-        return (loss, outputs) if return_outputs else loss
\ No newline at end of file
+        return (loss, outputs) if return_outputs else loss